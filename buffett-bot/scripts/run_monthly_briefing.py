@@ -42,7 +42,7 @@ from dotenv import load_dotenv
 from src.analyzer import CompanyAnalyzer, set_cache_dir
 from src.benchmark import fetch_benchmark_data, set_benchmark_cache_dir
 from src.briefing import BriefingGenerator, StockBriefing
-from src.bubble_detector import BubbleDetector, get_market_temperature
+from src.bubble_detector import BubbleDetector, get_market_temperature, set_bubble_cache_dir
 from src.config import config
 from src.edgar_fetcher import augment_filing_text
 from src.notifications import NotificationManager
@@ -176,6 +176,7 @@ def run_monthly_briefing(max_analyses: int = 10, use_cache: bool = True, send_no
 
     set_cache_dir(data_dir / "analyses")
     set_benchmark_cache_dir(data_dir / "benchmark")
+    set_bubble_cache_dir(data_dir / "bubble")
     watchlist_cache = data_dir / "watchlist_cache.json"
 
     # ─────────────────────────────────────────────────────────────
@@ -751,9 +752,8 @@ def run_monthly_briefing(max_analyses: int = 10, use_cache: bool = True, send_no
     )
 
     # Read the generated HTML for email delivery
-    html_content = None
-    if hasattr(generator, "html_path") and generator.html_path.exists():
-        html_content = generator.html_path.read_text()
+    html_content = generator.read_html()
+    if html_content is not None:
         logger.info(f"HTML briefing: {generator.html_path}")
 
     # ─────────────────────────────────────────────────────────────
@@ -196,19 +196,26 @@ class MoatRating(Enum):
     NARROW = "narrow"  # Some advantage, but less durable
     NONE = "none"  # No meaningful competitive advantage
 
+    def __init__(self, value: str):
+        # Display form ("WIDE"), computed once per member instead of per render
+        self.label = value.upper()
+
 
 class ManagementRating(Enum):
     EXCELLENT = "excellent"  # Aligned, competent, honest
     ADEQUATE = "adequate"  # Acceptable
     POOR = "poor"  # Red flags present
 
+    def __init__(self, value: str):
+        self.label = value.upper()
+
 
 # ─────────────────────────────────────────────────────────────
 # Analysis dataclass
 # ─────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisV2:
     """
     LLM analysis — quality-focused with moat, durability,
@@ -501,9 +508,9 @@ class CompanyAnalyzer:
         # Build user prompt with Sonnet's analysis as context
         sonnet_summary = (
             f"PRIOR ANALYST ASSESSMENT FOR {company_name} ({symbol}):\n"
-            f"- Moat: {sonnet_analysis.moat_rating.value.upper()} "
+            f"- Moat: {sonnet_analysis.moat_rating.label} "
             f"({', '.join(sonnet_analysis.moat_sources[:3])})\n"
-            f"- Management: {sonnet_analysis.management_rating.value.upper()}\n"
+            f"- Management: {sonnet_analysis.management_rating.label}\n"
             f"- Conviction: {sonnet_analysis.conviction_level}\n"
             f"- Thesis: {sonnet_analysis.investment_thesis[:300]}\n"
             f"- Key Risks: {'; '.join(sonnet_analysis.key_risks[:3])}\n"
@@ -13,25 +13,38 @@ v2.0 — Tiered Watchlist Format:
 - Approaching-target alerts
 """
 
+import gzip
+import html
 import json
 import logging
-from dataclasses import dataclass, field
-from datetime import datetime
+import math
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Collection, Optional
 
-from ..tier_engine import WatchlistMovement
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+from ..tier_engine import WatchlistMovement, staged_entry_suggestion
 from ..valuation import AggregatedValuation
 from .db_briefing import generate_briefing_from_db
-from .html_formatter import generate_html_report
-from .text_formatter import generate_text_report
+from .html_formatter import write_html_report
+from .text_formatter import generate_empty_text_report, generate_text_report
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["StockBriefing", "BriefingGenerator", "generate_briefing_from_db"]
 
+OUTPUT_FORMATS = ("txt", "html", "json")
+
 
-@dataclass
+@dataclass(slots=True)
 class StockBriefing:
     """Complete briefing for a single stock (v2 — tiered)."""
 
@@ -73,6 +86,23 @@ class StockBriefing:
 
     generated_at: datetime = field(default_factory=datetime.now)
 
+    # HTML-escaped copies of the identity fields, computed once at construction.
+    # Registry rows can carry a null company_name, so None escapes to "".
+    escaped_symbol: str = field(init=False, repr=False, compare=False)
+    escaped_company: str = field(init=False, repr=False, compare=False)
+    escaped_reason: str = field(init=False, repr=False, compare=False)
+
+    # Tier 1 staged-entry plan, shared by the text and HTML formatters
+    tranches: list[dict] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.escaped_symbol = html.escape(self.symbol)
+        self.escaped_company = html.escape(self.company_name or "")
+        self.escaped_reason = html.escape(self.tier_reason or "")
+        self.tranches = (
+            staged_entry_suggestion(self.target_entry_price) if self.tier == 1 and self.target_entry_price else []
+        )
+
     @property
     def recommendation(self) -> str:
         """Backward-compatible recommendation derived from tier."""
@@ -89,11 +119,17 @@ class BriefingGenerator:
 
     v2.0 — tiered watchlist format with movement log.
     Orchestrates text, HTML, and JSON output generation.
+
+    With compress_html=True the HTML report is written as briefing_YYYY_MM.html.gz
+    (gzip level 1) and html_path points at the compressed file; use read_html()
+    to get the markup back either way.
     """
 
-    def __init__(self, output_dir: str = "./data/briefings"):
+    def __init__(self, output_dir: str = "./data/briefings", compress_html: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.compress_html = compress_html
+        self.html_path: Optional[Path] = None
 
     def generate_briefing(
         self,
@@ -107,14 +143,46 @@ class BriefingGenerator:
         benchmark_data: Optional[dict] = None,
         movements: Optional[list[WatchlistMovement]] = None,
         campaign_progress: Optional[dict] = None,
+        formats: Collection[str] = OUTPUT_FORMATS,
     ) -> str:
         """
         Generate a complete monthly briefing document.
 
+        Args:
+            formats: Which of "txt", "html", "json" to write to disk. The text
+                report is always built, since it is the return value.
+
         Returns:
-            Formatted briefing as string (also saves text, HTML, JSON to files)
+            Formatted briefing as string (also saves the requested formats to files)
         """
+        # read_html() must only reflect this call, not an earlier run on the same generator
+        self.html_path = None
+
+        unknown = set(formats) - set(OUTPUT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown briefing formats: {sorted(unknown)}")
+
         now = datetime.now()
+        stem = f"briefing_{now.strftime('%Y_%m')}"
+
+        # Nothing to report: write a stub text briefing and skip the HTML/JSON outputs
+        if not (
+            briefings
+            or portfolio_summary
+            or market_temp
+            or bubble_warnings
+            or radar_stocks
+            or performance_metrics
+            or benchmark_data
+            or movements
+            or campaign_progress
+        ):
+            briefing_text = generate_empty_text_report(now)
+            if "txt" in formats:
+                filepath = self.output_dir / f"{stem}.txt"
+                filepath.write_bytes(briefing_text.encode("utf-8"))
+                logger.info(f"No briefing data — stub saved to {filepath}")
+            return briefing_text
 
         # Generate text report
         briefing_text = generate_text_report(
@@ -128,48 +196,118 @@ class BriefingGenerator:
             benchmark_data,
             movements,
             campaign_progress,
+            now,
         )
 
         # Save text
-        filename = f"briefing_{now.strftime('%Y_%m')}.txt"
-        filepath = self.output_dir / filename
-        filepath.write_text(briefing_text)
-        logger.info(f"Briefing saved to {filepath}")
+        if "txt" in formats:
+            filepath = self.output_dir / f"{stem}.txt"
+            filepath.write_bytes(briefing_text.encode("utf-8"))
+            logger.info(f"Briefing saved to {filepath}")
 
         # Save JSON
-        json_data = _build_json_output(
-            briefings,
-            portfolio_summary,
-            market_temp,
-            bubble_warnings,
-            radar_stocks,
-            performance_metrics,
-            benchmark_data,
-            movements,
-        )
-        json_path = self.output_dir / f"briefing_{now.strftime('%Y_%m')}.json"
-        json_path.write_text(json.dumps(json_data, indent=2, default=str))
-
-        # Generate and save HTML
-        html_content = generate_html_report(
-            briefings,
-            portfolio_summary,
-            market_temp,
-            bubble_warnings,
-            radar_stocks,
-            radar_context,
-            performance_metrics,
-            benchmark_data,
-            movements,
-            campaign_progress,
-        )
-        html_filename = f"briefing_{now.strftime('%Y_%m')}.html"
-        self.html_path = self.output_dir / html_filename
-        self.html_path.write_text(html_content)
-        logger.info(f"HTML briefing saved to {self.html_path}")
+        if "json" in formats:
+            json_data = _build_json_output(
+                briefings,
+                portfolio_summary,
+                market_temp,
+                bubble_warnings,
+                radar_stocks,
+                performance_metrics,
+                benchmark_data,
+                movements,
+                now=now,
+            )
+            json_path = self.output_dir / f"{stem}.json"
+            _write_json(json_path, json_data)
+
+        # Stream HTML straight to disk rather than building the full string
+        if "html" in formats:
+            if self.compress_html:
+                self.html_path = self.output_dir / f"{stem}.html.gz"
+                html_file = gzip.open(self.html_path, "wt", compresslevel=1, encoding="utf-8")
+            else:
+                self.html_path = self.output_dir / f"{stem}.html"
+                html_file = self.html_path.open("w", encoding="utf-8")
+            with html_file as fp:
+                write_html_report(
+                    fp,
+                    briefings,
+                    portfolio_summary,
+                    market_temp,
+                    bubble_warnings,
+                    radar_stocks,
+                    radar_context,
+                    performance_metrics,
+                    benchmark_data,
+                    movements,
+                    campaign_progress,
+                    now,
+                )
+            logger.info(f"HTML briefing saved to {self.html_path}")
 
         return briefing_text
 
+    def read_html(self) -> Optional[str]:
+        """Return the last HTML report written by generate_briefing, or None if there is none."""
+        path = self.html_path
+        if path is None or not path.exists():
+            return None
+        if path.suffix == ".gz":
+            with gzip.open(path, "rt", encoding="utf-8") as fp:
+                return fp.read()
+        return path.read_text(encoding="utf-8")
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """
+    Write the JSON sidecar, using orjson when installed.
+
+    The stdlib fallback normalizes its input to orjson's conventions first:
+    ISO-8601 datetimes, enums as their values, dataclasses as dicts, numpy
+    values as plain numbers/lists, and NaN/inf as null. Anything orjson cannot
+    encode (e.g. integers wider than 64 bits) falls back to the stdlib path.
+    """
+    if _HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        try:
+            path.write_bytes(orjson.dumps(data, default=str, option=option))
+            return
+        except orjson.JSONEncodeError as e:
+            logger.warning(f"orjson could not encode {path.name} ({e}); using stdlib json")
+    # Stream the stdlib encoder's chunks instead of building the whole document string
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(_json_safe(data), fp, indent=2, default=str)
+
+
+def _json_safe(obj):
+    """Recursively convert obj to what orjson would emit for it (stdlib fallback only)."""
+    if isinstance(obj, dict):
+        return {_json_safe_key(k): _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(v) for v in obj]
+    if isinstance(obj, Enum):
+        return _json_safe(obj.value)
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _json_safe(asdict(obj))
+    if type(obj).__module__ == "numpy" and hasattr(obj, "tolist"):
+        return _json_safe(obj.tolist())
+    return obj
+
+
+def _json_safe_key(key):
+    if isinstance(key, Enum):
+        return _json_safe_key(key.value)
+    if isinstance(key, (date, time)):
+        return key.isoformat()
+    if key is None or isinstance(key, (str, int, float, bool)):
+        return key
+    return str(key)
+
 
 def _build_json_output(
     briefings: list[StockBriefing],
@@ -180,15 +318,30 @@ def _build_json_output(
     performance_metrics: Optional[dict],
     benchmark_data: Optional[dict] = None,
     movements: Optional[list[WatchlistMovement]] = None,
+    *,
+    now: datetime,
 ) -> dict:
     """Build JSON structure for programmatic access."""
-    tier1 = [b for b in briefings if b.tier == 1]
-    tier2 = [b for b in briefings if b.tier == 2]
-    tier3 = [b for b in briefings if b.tier == 3]
+    # Single pass: bucket by tier and count approaching Tier 2 names as we go
+    tier1: list[StockBriefing] = []
+    tier2: list[StockBriefing] = []
+    tier3: list[StockBriefing] = []
+    approaching = 0
+    for b in briefings:
+        # Equality checks, not range/index: fresh tier assignments can carry S/A/B/C strings
+        tier = b.tier
+        if tier == 1:
+            tier1.append(b)
+        elif tier == 2:
+            tier2.append(b)
+            if b.approaching_target:
+                approaching += 1
+        elif tier == 3:
+            tier3.append(b)
 
     return {
         "schema_version": "v2",
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": now.isoformat(),
         "market_temperature": market_temp,
         "benchmark": benchmark_data,
         "summary": {
@@ -196,7 +349,7 @@ def _build_json_output(
             "tier1_count": len(tier1),
             "tier2_count": len(tier2),
             "tier3_count": len(tier3),
-            "approaching_target": sum(1 for b in tier2 if b.approaching_target),
+            "approaching_target": approaching,
             "bubble_warnings": len(bubble_warnings) if bubble_warnings else 0,
             "radar": len(radar_stocks) if radar_stocks else 0,
         },
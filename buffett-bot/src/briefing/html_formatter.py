@@ -8,15 +8,151 @@ Extracted from briefing.py for separation of concerns.
 from __future__ import annotations
 
 import html as html_module
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from itertools import repeat
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterator, Optional, TextIO, cast
 
-from ..tier_engine import WatchlistMovement, staged_entry_suggestion
+from ..tier_engine import WatchlistMovement
 
 if TYPE_CHECKING:
     from ..bubble_detector import BubbleWarning
     from . import StockBriefing
 
+# Above this many Tier 1 + Tier 2 cards, render them on a thread pool.
+# Typical monthly briefings stay well below it and skip pool start-up.
+_PARALLEL_CARD_THRESHOLD = 30
+
+# Lookup tables used per report / per card, built once at import.
+_TEMP_COLORS = {
+    "COLD": ("#2196F3", "&#x1F976;"),
+    "COOL": ("#4CAF50", "&#x1F60E;"),
+    "WARM": ("#FF9800", "&#x1F630;"),
+    "HOT": ("#F44336", "&#x1F525;"),
+    "UNKNOWN": ("#9E9E9E", "&#x2753;"),
+}
+_AGREEMENT_COLORS = {
+    "AGREE": "#4CAF50",
+    "PARTIALLY_AGREE": "#FF9800",
+    "DISAGREE": "#F44336",
+}
+# Fully rendered badges for the known temperatures and card tiers; only
+# unexpected values are formatted at render time.
+_TEMP_BADGES = {
+    temp: f'  <div class="temp-badge" style="background:{color}">{icon} {temp}</div>'
+    for temp, (color, icon) in _TEMP_COLORS.items()
+}
+_TIER_BADGES = {
+    "tier1": '<span class="tier-badge tier-1">TIER 1</span>',
+    "tier2": '<span class="tier-badge tier-2">TIER 2</span>',
+    "tier3": '<span class="tier-badge tier-3">TIER 3</span>',
+}
+# change_type -> (badge class, escaped label) for the movement log.
+_MOVEMENT_BADGES = {
+    "new": ("mv-new", "NEW"),
+    "removed": ("mv-removed", "REMOVED"),
+    "tier_up": ("mv-up", "TIER UP"),
+    "tier_down": ("mv-down", "TIER DOWN"),
+    "approaching": ("mv-approaching", "APPROACHING"),
+}
+
+# Static stylesheet, built once at import rather than re-interpolated as part
+# of the header f-string on every render.
+_STYLE = """\
+*{box-sizing:border-box;margin:0;padding:0}
+body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;
+  background:#f5f5f5;color:#333;line-height:1.6}
+.container{max-width:900px;margin:0 auto;padding:16px}
+header{background:#1a237e;color:#fff;padding:32px 24px;border-radius:8px 8px 0 0;
+  margin-bottom:0}
+header h1{font-size:1.5rem;font-weight:600}
+header .date{opacity:.8;font-size:.9rem;margin-top:4px}
+.temp-badge{display:inline-block;padding:6px 16px;border-radius:20px;
+  font-weight:600;margin-top:12px;font-size:1rem}
+section{background:#fff;padding:24px;margin-bottom:2px}
+section:last-child{border-radius:0 0 8px 8px;margin-bottom:24px}
+h2{font-size:1.2rem;color:#1a237e;border-bottom:2px solid #e8eaf6;
+  padding-bottom:8px;margin-bottom:16px}
+.summary-grid{display:flex;flex-wrap:wrap;gap:12px;margin-bottom:16px}
+.summary-card{background:#f5f5f5;border-radius:8px;padding:16px;text-align:center;
+  flex:1 1 0;min-width:80px}
+.summary-card .num{font-size:1.8rem;font-weight:700;color:#1a237e}
+.summary-card .label{font-size:.8rem;color:#666;text-transform:uppercase}
+.stock-card{border:1px solid #e0e0e0;border-radius:8px;padding:20px;margin-bottom:16px;
+  border-left:4px solid #ccc}
+.stock-card.tier1{border-left-color:#4CAF50}
+.stock-card.tier2{border-left-color:#FF9800}
+.stock-card.tier3{border-left-color:#90A4AE}
+.stock-card.approaching{border-left-color:#E91E63;border-left-width:6px}
+.stock-card.bubble{border-left-color:#F44336}
+.stock-card h3{font-size:1.1rem;margin-bottom:4px}
+.tier-badge{display:inline-block;padding:2px 10px;border-radius:12px;
+  font-size:.75rem;font-weight:600;color:#fff;margin-bottom:12px}
+.tier-1{background:#4CAF50}
+.tier-2{background:#FF9800}
+.tier-3{background:#90A4AE}
+.tier-approaching{background:#E91E63}
+table{width:100%;border-collapse:collapse;margin:12px 0;font-size:.9rem}
+table th{text-align:left;padding:8px 12px;background:#f5f5f5;border-bottom:2px solid #ddd;
+  font-weight:600;color:#555}
+table td{padding:8px 12px;border-bottom:1px solid #eee}
+table td:last-child{text-align:right}
+table th:last-child{text-align:right}
+details{margin:8px 0}
+summary{cursor:pointer;font-weight:600;color:#1a237e;padding:4px 0}
+summary:hover{text-decoration:underline}
+.bar-chart{margin:8px 0}
+.bar-row{display:flex;align-items:center;margin:4px 0;font-size:.85rem}
+.bar-label{width:160px;flex-shrink:0;text-align:right;padding-right:12px;color:#555}
+.bar-track{flex:1;background:#e8eaf6;border-radius:4px;height:20px;position:relative}
+.bar-fill{background:#3f51b5;border-radius:4px;height:100%;min-width:2px}
+.bar-pct{width:50px;text-align:right;padding-left:8px;color:#555;font-size:.8rem}
+.radar-grid{display:flex;flex-wrap:wrap;gap:8px;margin-top:8px;max-width:100%;overflow:hidden}
+.radar-chip{background:#e8eaf6;color:#3f51b5;padding:4px 12px;border-radius:16px;
+  font-size:.8rem;font-weight:500}
+.portfolio-stats{display:flex;flex-wrap:wrap;gap:12px;margin-bottom:16px}
+.portfolio-stat{padding:8px 0;flex:1 1 0;min-width:120px}
+.portfolio-stat .val{font-size:1.2rem;font-weight:600}
+.portfolio-stat .lbl{font-size:.8rem;color:#666}
+.gain-pos{color:#4CAF50}
+.gain-neg{color:#F44336}
+footer{text-align:center;padding:16px;font-size:.8rem;color:#999}
+.sizing{background:#e8f5e9;border-radius:6px;padding:12px;margin-bottom:12px;font-size:.9rem}
+.staged-entry{background:#e3f2fd;border-radius:6px;padding:12px;margin:8px 0;font-size:.9rem}
+.movement-log{margin:8px 0;font-size:.9rem}
+.movement-item{padding:4px 0;display:flex;align-items:center;gap:8px}
+.movement-badge{display:inline-block;padding:1px 8px;border-radius:8px;font-size:.7rem;
+  font-weight:600;color:#fff}
+.mv-new{background:#4CAF50}
+.mv-removed{background:#9E9E9E}
+.mv-up{background:#2196F3}
+.mv-down{background:#FF9800}
+.mv-approaching{background:#E91E63}
+@media(max-width:600px){
+  .container{padding:8px}
+  header{padding:20px 16px}
+  section{padding:16px}
+  .summary-card{min-width:60px}
+  .portfolio-stat{min-width:100px}
+  .bar-label{width:100px;font-size:.75rem}
+}
+"""
+
+# Static head/footer chunks around the per-run title, date and month stamps.
+_HEAD_STATIC = f"""<style>
+{_STYLE}</style>
+</head>
+<body>
+<div class="container">
+<header>"""
+
+_DISCLAIMER = """<section style="background:#fafafa;font-size:.85rem;color:#777">
+<p><strong>Disclaimer:</strong> This briefing is for research purposes only. All valuations are estimates.
+You make the final investment decision. Past performance does not guarantee future results.
+Patience is the strategy.</p>
+</section>"""
+
 
 def generate_html_report(
     briefings: list[StockBriefing],
@@ -29,155 +165,150 @@ def generate_html_report(
     benchmark_data: Optional[dict] = None,
     movements: Optional[list[WatchlistMovement]] = None,
     campaign_progress: Optional[dict] = None,
+    now: Optional[datetime] = None,
 ) -> str:
     """Generate a self-contained HTML briefing report."""
-    now = datetime.now()
+    return "\n".join(
+        iter_html_report(
+            briefings,
+            portfolio_summary,
+            market_temp,
+            bubble_warnings,
+            radar_stocks,
+            radar_context,
+            performance_metrics,
+            benchmark_data,
+            movements,
+            campaign_progress,
+            now,
+        )
+    )
+
+
+def write_html_report(
+    fp: TextIO,
+    briefings: list[StockBriefing],
+    portfolio_summary: Optional[dict] = None,
+    market_temp: Optional[dict] = None,
+    bubble_warnings: Optional[list] = None,
+    radar_stocks: Optional[list[str]] = None,
+    radar_context: Optional[dict] = None,
+    performance_metrics: Optional[dict] = None,
+    benchmark_data: Optional[dict] = None,
+    movements: Optional[list[WatchlistMovement]] = None,
+    campaign_progress: Optional[dict] = None,
+    now: Optional[datetime] = None,
+) -> None:
+    """Stream the HTML briefing report to an open text file, chunk by chunk."""
+    chunks = iter_html_report(
+        briefings,
+        portfolio_summary,
+        market_temp,
+        bubble_warnings,
+        radar_stocks,
+        radar_context,
+        performance_metrics,
+        benchmark_data,
+        movements,
+        campaign_progress,
+        now,
+    )
+    fp.write(next(chunks))
+    for chunk in chunks:
+        fp.write("\n")
+        fp.write(chunk)
+
+
+def iter_html_report(
+    briefings: list[StockBriefing],
+    portfolio_summary: Optional[dict] = None,
+    market_temp: Optional[dict] = None,
+    bubble_warnings: Optional[list] = None,
+    radar_stocks: Optional[list[str]] = None,
+    radar_context: Optional[dict] = None,
+    performance_metrics: Optional[dict] = None,
+    benchmark_data: Optional[dict] = None,
+    movements: Optional[list[WatchlistMovement]] = None,
+    campaign_progress: Optional[dict] = None,
+    now: Optional[datetime] = None,
+) -> Iterator[str]:
+    """
+    Yield the HTML briefing report as line-sized chunks.
+
+    Joining the chunks with newlines gives generate_html_report(); streaming
+    them lets callers write to disk without holding the whole report.
+    """
+    if now is None:
+        now = datetime.now()
     month_str = now.strftime("%B %Y")
     e = html_module.escape
 
-    tier1 = sorted([b for b in briefings if b.tier == 1], key=lambda x: abs(x.price_gap_pct or 0))
-    tier2 = sorted([b for b in briefings if b.tier == 2], key=lambda x: abs(x.price_gap_pct or 999))
-    tier3 = [b for b in briefings if b.tier == 3]
+    # One pass to partition, then sort each tier in place. Tiers are compared
+    # by equality only: fresh assignments may carry letter tiers (S/A/B/C).
+    tier1: list[StockBriefing] = []
+    tier2: list[StockBriefing] = []
+    tier3: list[StockBriefing] = []
+    for b in briefings:
+        tier = b.tier
+        if tier == 1:
+            tier1.append(b)
+        elif tier == 2:
+            tier2.append(b)
+        elif tier == 3:
+            tier3.append(b)
+    tier1.sort(key=lambda x: abs(x.price_gap_pct or 0))
+    tier2.sort(key=lambda x: abs(x.price_gap_pct or 999))
     approaching = [b for b in tier2 if b.approaching_target]
+    parallel_cards = len(tier1) + len(tier2) > _PARALLEL_CARD_THRESHOLD
 
-    # Market temperature colors
-    temp_colors = {
-        "COLD": ("#2196F3", "&#x1F976;"),
-        "COOL": ("#4CAF50", "&#x1F60E;"),
-        "WARM": ("#FF9800", "&#x1F630;"),
-        "HOT": ("#F44336", "&#x1F525;"),
-        "UNKNOWN": ("#9E9E9E", "&#x2753;"),
-    }
-    temp_val = market_temp.get("temperature", "UNKNOWN") if market_temp else "UNKNOWN"
-    temp_color, temp_icon = temp_colors.get(temp_val, temp_colors["UNKNOWN"])
-
-    parts: list[str] = []
-    parts.append(f"""<!DOCTYPE html>
+    month_e = e(month_str)
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
-<title>Watchlist Update - {e(month_str)}</title>
-<style>
-*{{box-sizing:border-box;margin:0;padding:0}}
-body{{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;
-  background:#f5f5f5;color:#333;line-height:1.6}}
-.container{{max-width:900px;margin:0 auto;padding:16px}}
-header{{background:#1a237e;color:#fff;padding:32px 24px;border-radius:8px 8px 0 0;
-  margin-bottom:0}}
-header h1{{font-size:1.5rem;font-weight:600}}
-header .date{{opacity:.8;font-size:.9rem;margin-top:4px}}
-.temp-badge{{display:inline-block;padding:6px 16px;border-radius:20px;
-  font-weight:600;margin-top:12px;font-size:1rem}}
-section{{background:#fff;padding:24px;margin-bottom:2px}}
-section:last-child{{border-radius:0 0 8px 8px;margin-bottom:24px}}
-h2{{font-size:1.2rem;color:#1a237e;border-bottom:2px solid #e8eaf6;
-  padding-bottom:8px;margin-bottom:16px}}
-.summary-grid{{display:flex;flex-wrap:wrap;gap:12px;margin-bottom:16px}}
-.summary-card{{background:#f5f5f5;border-radius:8px;padding:16px;text-align:center;
-  flex:1 1 0;min-width:80px}}
-.summary-card .num{{font-size:1.8rem;font-weight:700;color:#1a237e}}
-.summary-card .label{{font-size:.8rem;color:#666;text-transform:uppercase}}
-.stock-card{{border:1px solid #e0e0e0;border-radius:8px;padding:20px;margin-bottom:16px;
-  border-left:4px solid #ccc}}
-.stock-card.tier1{{border-left-color:#4CAF50}}
-.stock-card.tier2{{border-left-color:#FF9800}}
-.stock-card.tier3{{border-left-color:#90A4AE}}
-.stock-card.approaching{{border-left-color:#E91E63;border-left-width:6px}}
-.stock-card.bubble{{border-left-color:#F44336}}
-.stock-card h3{{font-size:1.1rem;margin-bottom:4px}}
-.tier-badge{{display:inline-block;padding:2px 10px;border-radius:12px;
-  font-size:.75rem;font-weight:600;color:#fff;margin-bottom:12px}}
-.tier-1{{background:#4CAF50}}
-.tier-2{{background:#FF9800}}
-.tier-3{{background:#90A4AE}}
-.tier-approaching{{background:#E91E63}}
-table{{width:100%;border-collapse:collapse;margin:12px 0;font-size:.9rem}}
-table th{{text-align:left;padding:8px 12px;background:#f5f5f5;border-bottom:2px solid #ddd;
-  font-weight:600;color:#555}}
-table td{{padding:8px 12px;border-bottom:1px solid #eee}}
-table td:last-child{{text-align:right}}
-table th:last-child{{text-align:right}}
-details{{margin:8px 0}}
-summary{{cursor:pointer;font-weight:600;color:#1a237e;padding:4px 0}}
-summary:hover{{text-decoration:underline}}
-.bar-chart{{margin:8px 0}}
-.bar-row{{display:flex;align-items:center;margin:4px 0;font-size:.85rem}}
-.bar-label{{width:160px;flex-shrink:0;text-align:right;padding-right:12px;color:#555}}
-.bar-track{{flex:1;background:#e8eaf6;border-radius:4px;height:20px;position:relative}}
-.bar-fill{{background:#3f51b5;border-radius:4px;height:100%;min-width:2px}}
-.bar-pct{{width:50px;text-align:right;padding-left:8px;color:#555;font-size:.8rem}}
-.radar-grid{{display:flex;flex-wrap:wrap;gap:8px;margin-top:8px;max-width:100%;overflow:hidden}}
-.radar-chip{{background:#e8eaf6;color:#3f51b5;padding:4px 12px;border-radius:16px;
-  font-size:.8rem;font-weight:500}}
-.portfolio-stats{{display:flex;flex-wrap:wrap;gap:12px;margin-bottom:16px}}
-.portfolio-stat{{padding:8px 0;flex:1 1 0;min-width:120px}}
-.portfolio-stat .val{{font-size:1.2rem;font-weight:600}}
-.portfolio-stat .lbl{{font-size:.8rem;color:#666}}
-.gain-pos{{color:#4CAF50}}
-.gain-neg{{color:#F44336}}
-footer{{text-align:center;padding:16px;font-size:.8rem;color:#999}}
-.sizing{{background:#e8f5e9;border-radius:6px;padding:12px;margin-bottom:12px;font-size:.9rem}}
-.staged-entry{{background:#e3f2fd;border-radius:6px;padding:12px;margin:8px 0;font-size:.9rem}}
-.movement-log{{margin:8px 0;font-size:.9rem}}
-.movement-item{{padding:4px 0;display:flex;align-items:center;gap:8px}}
-.movement-badge{{display:inline-block;padding:1px 8px;border-radius:8px;font-size:.7rem;
-  font-weight:600;color:#fff}}
-.mv-new{{background:#4CAF50}}
-.mv-removed{{background:#9E9E9E}}
-.mv-up{{background:#2196F3}}
-.mv-down{{background:#FF9800}}
-.mv-approaching{{background:#E91E63}}
-@media(max-width:600px){{
-  .container{{padding:8px}}
-  header{{padding:20px 16px}}
-  section{{padding:16px}}
-  .summary-card{{min-width:60px}}
-  .portfolio-stat{{min-width:100px}}
-  .bar-label{{width:100px;font-size:.75rem}}
-}}
-</style>
-</head>
-<body>
-<div class="container">
-<header>
-  <h1>Watchlist Update &mdash; {e(month_str)}</h1>
-  <div class="date">Generated {now.strftime("%Y-%m-%d %H:%M")}</div>""")
+<title>Watchlist Update - {month_e}</title>"""
+    yield _HEAD_STATIC
+    yield f"""  <h1>Watchlist Update &mdash; {month_e}</h1>
+  <div class="date">Generated {now.strftime("%Y-%m-%d %H:%M")}</div>"""
 
     if market_temp:
-        parts.append(f"""  <div class="temp-badge" style="background:{temp_color}">{temp_icon} {e(temp_val)}</div>
-  <div style="margin-top:8px;font-size:.9rem;opacity:.9">{e(market_temp.get("interpretation", ""))}</div>""")
+        temp_val = market_temp.get("temperature", "UNKNOWN")
+        temp_badge = _TEMP_BADGES.get(temp_val)
+        if temp_badge is None:
+            temp_color, temp_icon = _TEMP_COLORS["UNKNOWN"]
+            temp_badge = f'  <div class="temp-badge" style="background:{temp_color}">{temp_icon} {e(temp_val)}</div>'
+        yield f"""{temp_badge}
+  <div style="margin-top:8px;font-size:.9rem;opacity:.9">{e(market_temp.get("interpretation", ""))}</div>"""
 
-    parts.append("</header>")
+    yield "</header>"
 
     # Executive Summary
-    parts.append("""<section>
+    yield """<section>
 <h2>Executive Summary</h2>
-<div class="summary-grid">""")
-    parts.append(
-        f'<div class="summary-card"><div class="num">{len(briefings)}</div><div class="label">Analyzed</div></div>'
-    )
-    parts.append(
+<div class="summary-grid">"""
+    yield f'<div class="summary-card"><div class="num">{len(briefings)}</div><div class="label">Analyzed</div></div>'
+    yield (
         f'<div class="summary-card"><div class="num" style="color:#4CAF50">{len(tier1)}</div><div class="label">Tier 1</div></div>'
     )
-    parts.append(
+    yield (
         f'<div class="summary-card"><div class="num" style="color:#FF9800">{len(tier2)}</div><div class="label">Tier 2</div></div>'
     )
-    parts.append(
+    yield (
         f'<div class="summary-card"><div class="num" style="color:#90A4AE">{len(tier3)}</div><div class="label">Tier 3</div></div>'
     )
     if approaching:
-        parts.append(
+        yield (
             f'<div class="summary-card"><div class="num" style="color:#E91E63">{len(approaching)}</div><div class="label">Approaching</div></div>'
         )
-    parts.append("</div>")
+    yield "</div>"
 
     # Campaign Progress
     if campaign_progress:
         cp = campaign_progress
         cov_pct = cp.get("coverage_pct", 0)
         bar_width = max(1, int(cov_pct * 100))
-        parts.append(
+        yield (
             f'<div style="background:#e8eaf6;border-radius:8px;padding:16px;margin:12px 0">'
             f'<div style="font-weight:600;margin-bottom:8px">Coverage Campaign: {e(str(cp.get("campaign_id", "")))}</div>'
             f'<div style="background:#c5cae9;border-radius:4px;height:24px;position:relative;overflow:hidden">'
@@ -199,70 +330,36 @@ footer{{text-align:center;padding:16px;font-size:.8rem;color:#999}}
         bm_pe = benchmark_data.get("pe_ratio")
         bm_ytd = benchmark_data.get("ytd_return")
         bm_1y = benchmark_data.get("one_year_return")
-        parts.append(f'<h3 style="font-size:1rem;margin:16px 0 8px">Benchmark: {bm_name}</h3>')
-        parts.append('<div style="display:flex;gap:16px;flex-wrap:wrap;margin-bottom:12px;font-size:.9rem">')
+        yield f'<h3 style="font-size:1rem;margin:16px 0 8px">Benchmark: {bm_name}</h3>'
+        yield '<div style="display:flex;gap:16px;flex-wrap:wrap;margin-bottom:12px;font-size:.9rem">'
         if bm_pe:
-            parts.append(f"<span>P/E: <strong>{bm_pe:.1f}</strong></span>")
+            yield f"<span>P/E: <strong>{bm_pe:.1f}</strong></span>"
         if bm_ytd is not None:
-            parts.append(f"<span>YTD: <strong>{bm_ytd:+.1%}</strong></span>")
+            yield f"<span>YTD: <strong>{bm_ytd:+.1%}</strong></span>"
         if bm_1y is not None:
-            parts.append(f"<span>1Y: <strong>{bm_1y:+.1%}</strong></span>")
-        parts.append("</div>")
-        parts.append("<table><tr><th>Stock</th><th>Tier</th><th>Price</th><th>Target</th><th>Gap</th></tr>")
-        for b in (tier1 + tier2)[:15]:
-            gap_str = f"{b.price_gap_pct:+.0%}" if b.price_gap_pct is not None else "N/A"
-            target_str = f"${b.target_entry_price:,.0f}" if b.target_entry_price else "N/A"
-            gap_color = ' style="color:#4CAF50"' if (b.price_gap_pct or 0) <= 0 else ""
-            parts.append(
-                f"<tr><td><strong>{e(b.symbol)}</strong></td>"
-                f"<td>T{b.tier}</td>"
-                f"<td>${b.current_price:,.0f}</td>"
-                f"<td>{target_str}</td>"
-                f"<td{gap_color}>{gap_str}</td></tr>"
-            )
-        parts.append("</table>")
+            yield f"<span>1Y: <strong>{bm_1y:+.1%}</strong></span>"
+        yield "</div>"
+        yield "<table><tr><th>Stock</th><th>Tier</th><th>Price</th><th>Target</th><th>Gap</th></tr>"
+        yield "\n".join(map(_html_benchmark_row, (tier1 + tier2)[:15]))
+        yield "</table>"
 
-    parts.append("</section>")
+    yield "</section>"
 
     # Movement Log
     if movements:
-        parts.append("<section><h2>Movement Log</h2><div class='movement-log'>")
-        for m in movements:
-            badge_class = {
-                "new": "mv-new",
-                "removed": "mv-removed",
-                "tier_up": "mv-up",
-                "tier_down": "mv-down",
-                "approaching": "mv-approaching",
-            }.get(m.change_type, "mv-removed")
-            label = m.change_type.upper().replace("_", " ")
-            parts.append(
-                f'<div class="movement-item">'
-                f'<span class="movement-badge {badge_class}">{e(label)}</span>'
-                f"<strong>{e(m.symbol)}</strong> {e(m.detail)}"
-                f"</div>"
-            )
-        parts.append("</div></section>")
+        yield "<section><h2>Movement Log</h2><div class='movement-log'>"
+        yield "\n".join(map(_html_movement_item, movements))
+        yield "</div></section>"
 
     # Approaching Target Alerts
     if approaching:
-        parts.append('<section><h2 style="color:#E91E63">Approaching Target Price</h2>')
-        parts.append(
+        yield '<section><h2 style="color:#E91E63">Approaching Target Price</h2>'
+        yield (
             '<p style="font-size:.9rem;color:#666;margin-bottom:12px">'
             "These Tier 2 companies are within striking distance of buy range.</p>"
         )
-        for b in approaching:
-            gap = b.price_gap_pct or 0
-            parts.append('<div class="stock-card approaching">')
-            parts.append(f"<h3>{e(b.symbol)}: {e(b.company_name)}</h3>")
-            parts.append('<span class="tier-badge tier-approaching">APPROACHING T1</span>')
-            parts.append(f"<table><tr><td>Current Price</td><td>${b.current_price:,.2f}</td></tr>")
-            parts.append(
-                f"<tr><td>Target Entry</td><td>${b.target_entry_price:,.2f}</td></tr>" if b.target_entry_price else ""
-            )
-            parts.append(f"<tr><td>Gap</td><td>{gap:+.1%}</td></tr></table>")
-            parts.append("</div>")
-        parts.append("</section>")
+        yield "\n".join(map(_html_approaching_card, approaching))
+        yield "</section>"
 
     # Portfolio Status
     if portfolio_summary:
@@ -270,191 +367,166 @@ footer{{text-align:center;padding:16px;font-size:.8rem;color:#999}}
         gain_pct = portfolio_summary.get("total_gain_loss_pct", 0)
         gain_class = "gain-pos" if gain >= 0 else "gain-neg"
         gain_sign = "+" if gain >= 0 else ""
-        parts.append(f"""<section>
+        yield f"""<section>
 <h2>Portfolio Status</h2>
 <div class="portfolio-stats">
   <div class="portfolio-stat"><div class="val">{portfolio_summary.get("position_count", 0)}</div><div class="lbl">Positions</div></div>
   <div class="portfolio-stat"><div class="val">${portfolio_summary.get("total_invested", 0):,.0f}</div><div class="lbl">Invested</div></div>
   <div class="portfolio-stat"><div class="val">${portfolio_summary.get("current_value", 0):,.0f}</div><div class="lbl">Current Value</div></div>
   <div class="portfolio-stat"><div class="val {gain_class}">{gain_sign}${gain:,.0f} ({gain_sign}{gain_pct:.1%})</div><div class="lbl">Gain/Loss</div></div>
-</div>""")
+</div>"""
 
-        positions = portfolio_summary.get("positions", [])
+        positions = portfolio_summary.get("positions")
         if positions:
-            parts.append('<h3 style="font-size:1rem;margin:16px 0 8px">Positions</h3>')
-            parts.append(
+            yield '<h3 style="font-size:1rem;margin:16px 0 8px">Positions</h3>'
+            yield (
                 "<table><tr><th>Ticker</th><th>Shares</th><th>Cost</th><th>Value</th><th>P&amp;L</th><th>P&amp;L%</th></tr>"
             )
-            for p in positions:
-                pl = p.get("unrealized_pl", 0)
-                plpc = p.get("unrealized_plpc", 0)
-                pl_color = "color:#4CAF50" if pl >= 0 else "color:#F44336"
-                pl_sign = "+" if pl >= 0 else ""
-                parts.append(
-                    f"<tr><td><strong>{e(p['symbol'])}</strong></td>"
-                    f"<td>{p.get('qty', 0):.1f}</td>"
-                    f"<td>${p.get('avg_entry_price', 0):.2f}</td>"
-                    f"<td>${p.get('market_value', 0):,.0f}</td>"
-                    f"<td style='{pl_color}'>{pl_sign}${abs(pl):,.0f}</td>"
-                    f"<td style='{pl_color}'>{pl_sign}{abs(plpc):.1%}</td></tr>"
-                )
-            parts.append("</table>")
+            yield "\n".join(map(_html_position_row, positions))
+            yield "</table>"
 
-        exposure = portfolio_summary.get("sector_exposure", {})
+        exposure = portfolio_summary.get("sector_exposure")
         if exposure:
-            parts.append('<h3 style="font-size:1rem;margin-bottom:8px">Sector Exposure</h3><div class="bar-chart">')
-            for sector, pct in sorted(exposure.items(), key=lambda x: x[1], reverse=True):
+            yield '<h3 style="font-size:1rem;margin-bottom:8px">Sector Exposure</h3><div class="bar-chart">'
+            for sector, pct in sorted(exposure.items(), key=itemgetter(1), reverse=True):
                 width = max(1, int(pct * 100))
-                parts.append(
+                yield (
                     f'<div class="bar-row"><span class="bar-label">{e(sector)}</span><div class="bar-track"><div class="bar-fill" style="width:{width}%"></div></div><span class="bar-pct">{pct:.0%}</span></div>'
                 )
-            parts.append("</div>")
-        parts.append("</section>")
+            yield "</div>"
+        yield "</section>"
 
     # Tier 1 Picks
     if tier1:
-        parts.append("<section><h2>Tier 1: Buy Zone</h2>")
-        for b in tier1:
-            parts.append(_html_stock_card(b, "tier1"))
-        parts.append("</section>")
+        yield "<section><h2>Tier 1: Buy Zone</h2>"
+        yield from _render_cards(tier1, "tier1", parallel_cards)
+        yield "</section>"
 
     # Second Opinion (Opus)
     opus_picks = [b for b in briefings if b.opus_opinion]
     if opus_picks:
-        parts.append("<section><h2>Second Opinion (Opus Contrarian Review)</h2>")
+        yield "<section><h2>Second Opinion (Opus Contrarian Review)</h2>"
         for b in opus_picks:
-            assert b.opus_opinion is not None  # nosec B101 — filtered above
-            op = b.opus_opinion
+            op = cast(dict, b.opus_opinion)  # filtered above
             agreement = op.get("agreement", "N/A")
             opus_conv = op.get("opus_conviction", "N/A")
-            badge_colors = {
-                "AGREE": "#4CAF50",
-                "PARTIALLY_AGREE": "#FF9800",
-                "DISAGREE": "#F44336",
-            }
-            badge_color = badge_colors.get(agreement, "#9E9E9E")
-            parts.append(f'<div class="stock-card" style="border-left-color:{badge_color}">')
-            parts.append(f"<h3>{e(b.symbol)}: {e(b.company_name)}</h3>")
-            parts.append(
+            badge_color = _AGREEMENT_COLORS.get(agreement, "#9E9E9E")
+            yield from (
+                f'<div class="stock-card" style="border-left-color:{badge_color}">',
+                f"<h3>{b.escaped_symbol}: {b.escaped_company}</h3>",
                 f'<span class="tier-badge" style="background:{badge_color}">{e(agreement)}</span> '
-                f'<span style="font-size:.85rem;color:#555">Opus Conviction: {e(opus_conv)}</span>'
+                f'<span style="font-size:.85rem;color:#555">Opus Conviction: {e(opus_conv)}</span>',
             )
-            risks = op.get("contrarian_risks", [])
+            risks = op.get("contrarian_risks")
             if risks:
-                parts.append(
+                yield (
                     "<details open><summary>Contrarian Risks</summary><ul style='font-size:.9rem;margin:8px 0 0 20px'>"
                 )
                 for risk in risks[:3]:
-                    parts.append(f"<li>{e(risk)}</li>")
-                parts.append("</ul></details>")
+                    yield f"<li>{e(risk)}</li>"
+                yield "</ul></details>"
             summary = op.get("summary", "")
             if summary:
-                parts.append(f'<p style="font-size:.9rem;margin-top:8px"><em>{e(summary[:300])}</em></p>')
-            parts.append("</div>")
-        parts.append("</section>")
+                yield f'<p style="font-size:.9rem;margin-top:8px"><em>{e(summary[:300])}</em></p>'
+            yield "</div>"
+        yield "</section>"
 
     # Tier 2 Watchlist
     if tier2:
-        parts.append("<section><h2>Tier 2: Watchlist</h2>")
-        for b in tier2:
-            parts.append(_html_stock_card(b, "tier2"))
-        parts.append("</section>")
+        yield "<section><h2>Tier 2: Watchlist</h2>"
+        yield from _render_cards(tier2, "tier2", parallel_cards)
+        yield "</section>"
 
     # Tier 3 Monitoring
     if tier3:
-        parts.append("<section><h2>Tier 3: Monitoring</h2>")
-        parts.append(
+        yield "<section><h2>Tier 3: Monitoring</h2>"
+        yield (
             '<p style="font-size:.9rem;color:#666;margin-bottom:12px">Good businesses to re-evaluate next cycle.</p>'
         )
-        parts.append("<table><tr><th>Stock</th><th>Moat</th><th>Conviction</th><th>P/E</th><th>FCF Yield</th></tr>")
-        for b in tier3:
-            moat = getattr(b.analysis, "moat_rating", None)
-            moat_str = moat.value.upper() if moat else "N/A"
-            conv = getattr(b.analysis, "conviction_level", "N/A")
-            pe_str = f"{b.pe_ratio:.1f}" if b.pe_ratio else "—"
-            fcf_str = f"{b.fcf_yield:.1%}" if b.fcf_yield is not None else "—"
-            parts.append(
-                f"<tr><td><strong>{e(b.symbol)}</strong></td>"
-                f"<td>{e(moat_str)}</td>"
-                f"<td>{e(conv)}</td>"
-                f"<td>{e(pe_str)}</td>"
-                f"<td>{e(fcf_str)}</td></tr>"
-            )
-        parts.append("</table></section>")
+        yield "<table><tr><th>Stock</th><th>Moat</th><th>Conviction</th><th>P/E</th><th>FCF Yield</th></tr>"
+        yield "\n".join(map(_html_tier3_row, tier3))
+        yield "</table></section>"
 
     # Radar
     if radar_stocks:
         ctx = radar_context or {}
         has_context = any(ctx.get(s) for s in radar_stocks)
         if has_context:
-            parts.append(
+            yield (
                 '<section><h2>Radar</h2><p style="font-size:.9rem;color:#666;margin-bottom:12px">Passed Haiku screening, not yet deeply analyzed.</p>'
                 "<table><tr><th>Ticker</th><th>Haiku Rationale</th></tr>"
             )
-            for s in radar_stocks:
-                reason = ctx.get(s, "")
-                parts.append(
-                    f"<tr><td><strong>{e(s)}</strong></td>"
-                    f"<td style='font-size:.85rem;color:#555'>{e(reason[:120]) if reason else '—'}</td></tr>"
-                )
-            parts.append("</table></section>")
+            yield "\n".join(
+                f"<tr><td><strong>{e(s)}</strong></td>"
+                f"<td style='font-size:.85rem;color:#555'>{e(reason[:120]) if (reason := ctx.get(s, '')) else '—'}</td></tr>"
+                for s in radar_stocks
+            )
+            yield "</table></section>"
         else:
-            parts.append(
+            yield (
                 '<section><h2>Radar</h2><p style="font-size:.9rem;color:#666;margin-bottom:12px">Passed screening, not yet analyzed.</p><div class="radar-grid">'
             )
-            for s in radar_stocks:
-                parts.append(f'<span class="radar-chip">{e(s)}</span>')
-            parts.append("</div></section>")
+            yield "\n".join(f'<span class="radar-chip">{e(s)}</span>' for s in radar_stocks)
+            yield "</div></section>"
 
     # Bubble Watch
     if bubble_warnings:
-        parts.append("<section><h2>Bubble Watch</h2>")
+        yield "<section><h2>Bubble Watch</h2>"
         for warning in bubble_warnings[:5]:
-            parts.append(_html_bubble_card(warning))
-        parts.append("</section>")
+            yield _html_bubble_card(warning)
+        yield "</section>"
 
     # Performance
     if performance_metrics and performance_metrics.get("total_trades", 0) > 0:
         pm = performance_metrics
-        parts.append(f"""<section>
+        yield f"""<section>
 <h2>Performance</h2>
 <table>
 <tr><th>Metric</th><th>Value</th></tr>
 <tr><td>Total Trades</td><td>{pm.get("total_trades", 0)}</td></tr>
 <tr><td>Winning Trades</td><td>{pm.get("winning_trades", 0)}</td></tr>
 <tr><td>Losing Trades</td><td>{pm.get("losing_trades", 0)}</td></tr>
-<tr><td>Win Rate</td><td>{pm.get("win_rate", 0):.0%}</td></tr></table></section>""")
+<tr><td>Win Rate</td><td>{pm.get("win_rate", 0):.0%}</td></tr></table></section>"""
 
     # Footer
-    parts.append(f"""<section style="background:#fafafa;font-size:.85rem;color:#777">
-<p><strong>Disclaimer:</strong> This briefing is for research purposes only. All valuations are estimates.
-You make the final investment decision. Past performance does not guarantee future results.
-Patience is the strategy.</p>
-</section>
-<footer>Buffett Bot v2.0 &middot; {e(month_str)}</footer>
+    yield _DISCLAIMER
+    yield f"""<footer>Buffett Bot v2.0 &middot; {month_e}</footer>
 </div>
 </body>
-</html>""")
+</html>"""
 
-    return "\n".join(parts)
+
+def _render_cards(briefings: list[StockBriefing], card_type: str, parallel: bool) -> list[str]:
+    """Render stock cards in order, fanning out to a thread pool for large briefings."""
+    if not parallel:
+        return [_html_stock_card(b, card_type) for b in briefings]
+    with ThreadPoolExecutor() as pool:
+        return list(pool.map(_html_stock_card, briefings, repeat(card_type)))
 
 
 def _html_stock_card(briefing: StockBriefing, card_type: str) -> str:
     """Build an HTML card for a stock (tier1, tier2, or tier3)."""
-    e = html_module.escape
-    tier_class = {"tier1": "tier-1", "tier2": "tier-2", "tier3": "tier-3"}.get(card_type, "tier-2")
-    tier_label = {"tier1": "TIER 1", "tier2": "TIER 2", "tier3": "TIER 3"}.get(card_type, f"TIER {briefing.tier}")
+    if card_type == "tier1" and _is_complete_tier1(briefing):
+        return _html_tier1_card_full(briefing)
 
-    lines = [f'<div class="stock-card {card_type}">']
-    lines.append(f"<h3>{e(briefing.symbol)}: {e(briefing.company_name)}</h3>")
-    lines.append(f'<span class="tier-badge {tier_class}">{tier_label}</span>')
+    e = html_module.escape
+    tier_badge = _TIER_BADGES.get(card_type) or f'<span class="tier-badge tier-2">TIER {briefing.tier}</span>'
+
+    lines = [
+        f'<div class="stock-card {card_type}">',
+        f"<h3>{briefing.escaped_symbol}: {briefing.escaped_company}</h3>",
+        tier_badge,
+    ]
+    append = lines.append
+    analysis = briefing.analysis
+    valuation = briefing.valuation
     if briefing.tier_reason:
-        lines.append(f'<span style="font-size:.85rem;color:#666;margin-left:8px">{e(briefing.tier_reason)}</span>')
+        append(f'<span style="font-size:.85rem;color:#666;margin-left:8px">{briefing.escaped_reason}</span>')
 
     # Position sizing for Tier 1
     if card_type == "tier1" and briefing.position_size:
         sz = briefing.position_size
-        lines.append(
+        append(
             f'<div class="sizing"><strong>Position Sizing ({e(str(sz.get("conviction", "MEDIUM")))} conviction):</strong> '
             f"Recommended {sz.get('recommended_pct', 0):.0%} (${sz.get('recommended_amount', 0):,.0f}) &middot; "
             f"Max {sz.get('max_pct', 0):.0%} (${sz.get('max_amount', 0):,.0f})</div>"
@@ -462,107 +534,189 @@ def _html_stock_card(briefing: StockBriefing, card_type: str) -> str:
 
     # Staged entry for Tier 1
     if card_type == "tier1" and briefing.target_entry_price:
-        tranches = staged_entry_suggestion(briefing.target_entry_price)
-        lines.append('<div class="staged-entry"><strong>Staged Entry Plan:</strong><br>')
-        for t in tranches:
-            lines.append(f"&bull; {e(t['label'])}<br>")
-        lines.append("</div>")
+        lines.extend(
+            (
+                '<div class="staged-entry"><strong>Staged Entry Plan:</strong><br>',
+                *[f"&bull; {e(t['label'])}<br>" for t in briefing.tranches],
+                "</div>",
+            )
+        )
 
     # Data table
-    lines.append("<table>")
-    lines.append(f"<tr><td>Price</td><td>${briefing.current_price:.2f}</td></tr>")
+    lines.extend(("<table>", f"<tr><td>Price</td><td>${briefing.current_price:.2f}</td></tr>"))
     if briefing.target_entry_price:
-        lines.append(f"<tr><td>Target Entry</td><td>${briefing.target_entry_price:.2f}</td></tr>")
+        append(f"<tr><td>Target Entry</td><td>${briefing.target_entry_price:.2f}</td></tr>")
     if briefing.price_gap_pct is not None:
         gap_color = "color:#4CAF50" if briefing.price_gap_pct <= 0 else "color:#F44336"
-        lines.append(f'<tr><td>Price vs Target</td><td style="{gap_color}">{briefing.price_gap_pct:+.1%}</td></tr>')
+        append(f'<tr><td>Price vs Target</td><td style="{gap_color}">{briefing.price_gap_pct:+.1%}</td></tr>')
 
-    avg_fv = briefing.valuation.average_fair_value or 0
-    mos = briefing.valuation.margin_of_safety or 0
+    avg_fv = valuation.average_fair_value or 0
+    mos = valuation.margin_of_safety or 0
     if avg_fv:
-        lines.append(f"<tr><td>Fair Value (avg)</td><td>${avg_fv:.2f}</td></tr>")
+        append(f"<tr><td>Fair Value (avg)</td><td>${avg_fv:.2f}</td></tr>")
     if mos:
-        lines.append(f"<tr><td>Margin of Safety</td><td>{mos:.1%}</td></tr>")
+        append(f"<tr><td>Margin of Safety</td><td>{mos:.1%}</td></tr>")
 
-    moat = getattr(briefing.analysis, "moat_rating", None)
+    moat = getattr(analysis, "moat_rating", None)
     if moat:
-        lines.append(f"<tr><td>Moat</td><td>{e(moat.value.upper())}</td></tr>")
-    conv = getattr(briefing.analysis, "conviction_level", None)
+        append(f"<tr><td>Moat</td><td>{e(moat.label)}</td></tr>")
+    conv = getattr(analysis, "conviction_level", None)
     if conv:
-        lines.append(f"<tr><td>Conviction</td><td>{e(conv)}</td></tr>")
+        append(f"<tr><td>Conviction</td><td>{e(conv)}</td></tr>")
     if briefing.pe_ratio:
-        lines.append(f"<tr><td>P/E Ratio</td><td>{briefing.pe_ratio:.1f}</td></tr>")
+        append(f"<tr><td>P/E Ratio</td><td>{briefing.pe_ratio:.1f}</td></tr>")
     if briefing.roe:
-        lines.append(f"<tr><td>ROE</td><td>{briefing.roe:.1%}</td></tr>")
+        append(f"<tr><td>ROE</td><td>{briefing.roe:.1%}</td></tr>")
     if briefing.debt_equity:
-        lines.append(f"<tr><td>Debt/Equity</td><td>{briefing.debt_equity:.2f}</td></tr>")
+        append(f"<tr><td>Debt/Equity</td><td>{briefing.debt_equity:.2f}</td></tr>")
     if briefing.fcf_yield is not None:
-        lines.append(f"<tr><td>FCF Yield</td><td>{briefing.fcf_yield:.1%}</td></tr>")
+        append(f"<tr><td>FCF Yield</td><td>{briefing.fcf_yield:.1%}</td></tr>")
     if briefing.operating_margin is not None:
-        lines.append(f"<tr><td>Operating Margin</td><td>{briefing.operating_margin:.1%}</td></tr>")
-    lines.append("</table>")
+        append(f"<tr><td>Operating Margin</td><td>{briefing.operating_margin:.1%}</td></tr>")
+    append("</table>")
+
+    lines.extend(_html_card_details(briefing, card_type))
+    append("</div>")
+    return "\n".join(lines)
+
+
+def _is_complete_tier1(briefing: StockBriefing) -> bool:
+    """True when every field guarded in the generic card is populated."""
+    analysis = briefing.analysis
+    valuation = briefing.valuation
+    return bool(
+        briefing.tier_reason
+        and briefing.position_size
+        and briefing.target_entry_price
+        and briefing.price_gap_pct is not None
+        and valuation.average_fair_value
+        and valuation.margin_of_safety
+        and getattr(analysis, "moat_rating", None)
+        and getattr(analysis, "conviction_level", None)
+        and briefing.pe_ratio
+        and briefing.roe
+        and briefing.debt_equity
+        and briefing.fcf_yield is not None
+        and briefing.operating_margin is not None
+    )
+
+
+def _html_tier1_card_full(briefing: StockBriefing) -> str:
+    """
+    Tier 1 card for a fully populated briefing.
+
+    Same markup as _html_stock_card, emitted straight-line without the
+    per-row presence checks. Callers must check _is_complete_tier1 first.
+    """
+    e = html_module.escape
+    sz = cast(dict, briefing.position_size)
+    target = cast(float, briefing.target_entry_price)
+    gap = cast(float, briefing.price_gap_pct)
+    valuation = briefing.valuation
+    analysis = briefing.analysis
+    gap_color = "color:#4CAF50" if gap <= 0 else "color:#F44336"
+
+    lines = [
+        '<div class="stock-card tier1">',
+        f"<h3>{briefing.escaped_symbol}: {briefing.escaped_company}</h3>",
+        _TIER_BADGES["tier1"],
+        f'<span style="font-size:.85rem;color:#666;margin-left:8px">{briefing.escaped_reason}</span>',
+        f'<div class="sizing"><strong>Position Sizing ({e(str(sz.get("conviction", "MEDIUM")))} conviction):</strong> '
+        f"Recommended {sz.get('recommended_pct', 0):.0%} (${sz.get('recommended_amount', 0):,.0f}) &middot; "
+        f"Max {sz.get('max_pct', 0):.0%} (${sz.get('max_amount', 0):,.0f})</div>",
+        '<div class="staged-entry"><strong>Staged Entry Plan:</strong><br>',
+        *[f"&bull; {e(t['label'])}<br>" for t in briefing.tranches],
+        "</div>",
+        "<table>",
+        f"<tr><td>Price</td><td>${briefing.current_price:.2f}</td></tr>",
+        f"<tr><td>Target Entry</td><td>${target:.2f}</td></tr>",
+        f'<tr><td>Price vs Target</td><td style="{gap_color}">{gap:+.1%}</td></tr>',
+        f"<tr><td>Fair Value (avg)</td><td>${valuation.average_fair_value:.2f}</td></tr>",
+        f"<tr><td>Margin of Safety</td><td>{valuation.margin_of_safety:.1%}</td></tr>",
+        f"<tr><td>Moat</td><td>{e(analysis.moat_rating.label)}</td></tr>",  # type: ignore[attr-defined]
+        f"<tr><td>Conviction</td><td>{e(analysis.conviction_level)}</td></tr>",  # type: ignore[attr-defined]
+        f"<tr><td>P/E Ratio</td><td>{briefing.pe_ratio:.1f}</td></tr>",
+        f"<tr><td>ROE</td><td>{briefing.roe:.1%}</td></tr>",
+        f"<tr><td>Debt/Equity</td><td>{briefing.debt_equity:.2f}</td></tr>",
+        f"<tr><td>FCF Yield</td><td>{briefing.fcf_yield:.1%}</td></tr>",
+        f"<tr><td>Operating Margin</td><td>{briefing.operating_margin:.1%}</td></tr>",
+        "</table>",
+    ]
+    lines.extend(_html_card_details(briefing, "tier1"))
+    lines.append("</div>")
+    return "\n".join(lines)
+
+
+def _html_card_details(briefing: StockBriefing, card_type: str) -> list[str]:
+    """Collapsible detail blocks shared by every stock card (estimates, thesis, risks)."""
+    e = html_module.escape
+    lines: list[str] = []
+    append = lines.append
+    analysis = briefing.analysis
+    key_risks = getattr(analysis, "key_risks", None)
 
     # Valuation estimates
-    if briefing.valuation.estimates:
-        lines.append("<details><summary>Valuation Estimates</summary><table>")
-        lines.append("<tr><th>Source</th><th>Fair Value</th></tr>")
-        for est in briefing.valuation.estimates[:6]:
-            lines.append(f"<tr><td>{e(est.source)}</td><td>${est.fair_value:.2f}</td></tr>")
-        lines.append("</table></details>")
+    estimates = briefing.valuation.estimates
+    if estimates:
+        lines.extend(
+            ("<details><summary>Valuation Estimates</summary><table>", "<tr><th>Source</th><th>Fair Value</th></tr>")
+        )
+        for est in estimates[:6]:
+            append(f"<tr><td>{e(est.source)}</td><td>${est.fair_value:.2f}</td></tr>")
+        append("</table></details>")
 
     # Bear case callout for Tier 2 (why you're not buying yet)
     if card_type == "tier2":
-        moat_risks = getattr(briefing.analysis, "moat_risks", "")
-        key_risks_t2 = getattr(briefing.analysis, "key_risks", [])
+        moat_risks = getattr(analysis, "moat_risks", "")
         bear_parts = []
         if moat_risks:
             bear_parts.append(f"<strong>Moat risk:</strong> {e(moat_risks[:120])}")
-        if key_risks_t2:
-            bear_parts.append(f"<strong>Key risk:</strong> {e(key_risks_t2[0][:120])}")
+        if key_risks:
+            bear_parts.append(f"<strong>Key risk:</strong> {e(key_risks[0][:120])}")
         if bear_parts:
-            lines.append(
+            append(
                 '<div style="background:#fff3e0;border-left:3px solid #FF9800;padding:10px 14px;'
                 'margin:12px 0;font-size:.88rem;border-radius:0 6px 6px 0">' + "<br>".join(bear_parts) + "</div>"
             )
 
     # Thesis
-    thesis = getattr(briefing.analysis, "investment_thesis", "")
+    thesis = getattr(analysis, "investment_thesis", "")
     if thesis:
-        lines.append(
+        append(
             f"<details><summary>Investment Thesis</summary><p style='font-size:.9rem;margin-top:8px'>{e(thesis[:600])}</p></details>"
         )
 
     # Risks
-    key_risks = getattr(briefing.analysis, "key_risks", [])
     if key_risks:
-        lines.append("<details><summary>Key Risks</summary><ul style='font-size:.9rem;margin:8px 0 0 20px'>")
+        append("<details><summary>Key Risks</summary><ul style='font-size:.9rem;margin:8px 0 0 20px'>")
         for risk in key_risks[:4]:
-            lines.append(f"<li>{e(risk)}</li>")
-        lines.append("</ul></details>")
+            append(f"<li>{e(risk)}</li>")
+        append("</ul></details>")
 
     # Thesis-breaking events
-    thesis_risks = getattr(briefing.analysis, "thesis_risks", [])
+    thesis_risks = getattr(analysis, "thesis_risks", None)
     if thesis_risks:
-        lines.append(
+        append(
             "<details><summary>Thesis-Breaking Events</summary><ul style='font-size:.9rem;margin:8px 0 0 20px;color:#d32f2f'>"
         )
         for risk in thesis_risks[:3]:
-            lines.append(f"<li>{e(risk)}</li>")
-        lines.append("</ul></details>")
+            append(f"<li>{e(risk)}</li>")
+        append("</ul></details>")
 
-    lines.append("</div>")
-    return "\n".join(lines)
+    return lines
 
 
 def _html_bubble_card(warning: BubbleWarning) -> str:
     """Build an HTML card for a bubble warning."""
     e = html_module.escape
     pe_str = f"{warning.pe_ratio:.1f}" if warning.pe_ratio else "N/A"
-    lines = ['<div class="stock-card bubble">']
-    lines.append(f"<h3>{e(warning.symbol)}: {e(warning.company_name)}</h3>")
-    lines.append(f'<span class="tier-badge" style="background:#F44336">{e(warning.risk_level)} RISK</span>')
-    lines.append(f"<table><tr><td>Price</td><td>${warning.current_price:.2f}</td></tr>")
-    lines.append(f"<tr><td>P/E</td><td>{e(pe_str)}</td></tr></table>")
+    lines = [
+        '<div class="stock-card bubble">',
+        f"<h3>{e(warning.symbol)}: {e(warning.company_name)}</h3>",
+        f'<span class="tier-badge" style="background:#F44336">{e(warning.risk_level)} RISK</span>',
+        f"<table><tr><td>Price</td><td>${warning.current_price:.2f}</td></tr>",
+        f"<tr><td>P/E</td><td>{e(pe_str)}</td></tr></table>",
+    ]
     if warning.signals:
         lines.append(
             "<details open><summary>Warning Signals</summary><ul style='font-size:.9rem;margin:8px 0 0 20px;color:#d32f2f'>"
@@ -572,3 +726,81 @@ def _html_bubble_card(warning: BubbleWarning) -> str:
         lines.append("</ul></details>")
     lines.append("</div>")
     return "\n".join(lines)
+
+
+# ─── Table rows ───────────────────────────────────────────────────────────────
+# One function per row shape so each table is emitted as a single
+# "\n".join chunk instead of one generator step per row.
+
+
+def _html_benchmark_row(b: StockBriefing) -> str:
+    gap_str = f"{b.price_gap_pct:+.0%}" if b.price_gap_pct is not None else "N/A"
+    target_str = f"${b.target_entry_price:,.0f}" if b.target_entry_price else "N/A"
+    gap_color = ' style="color:#4CAF50"' if (b.price_gap_pct or 0) <= 0 else ""
+    return (
+        f"<tr><td><strong>{b.escaped_symbol}</strong></td>"
+        f"<td>T{b.tier}</td>"
+        f"<td>${b.current_price:,.0f}</td>"
+        f"<td>{target_str}</td>"
+        f"<td{gap_color}>{gap_str}</td></tr>"
+    )
+
+
+def _html_movement_item(m: WatchlistMovement) -> str:
+    e = html_module.escape
+    badge = _MOVEMENT_BADGES.get(m.change_type)
+    if badge is None:
+        badge = ("mv-removed", e(m.change_type.upper().replace("_", " ")))
+    badge_class, label = badge
+    return (
+        f'<div class="movement-item">'
+        f'<span class="movement-badge {badge_class}">{label}</span>'
+        f"<strong>{e(m.symbol)}</strong> {e(m.detail)}"
+        f"</div>"
+    )
+
+
+def _html_approaching_card(b: StockBriefing) -> str:
+    gap = b.price_gap_pct or 0
+    target_row = f"<tr><td>Target Entry</td><td>${b.target_entry_price:,.2f}</td></tr>" if b.target_entry_price else ""
+    return (
+        f'<div class="stock-card approaching">\n'
+        f"<h3>{b.escaped_symbol}: {b.escaped_company}</h3>\n"
+        f'<span class="tier-badge tier-approaching">APPROACHING T1</span>\n'
+        f"<table><tr><td>Current Price</td><td>${b.current_price:,.2f}</td></tr>\n"
+        f"{target_row}\n"
+        f"<tr><td>Gap</td><td>{gap:+.1%}</td></tr></table>\n"
+        f"</div>"
+    )
+
+
+def _html_position_row(p: dict) -> str:
+    e = html_module.escape
+    pl = p.get("unrealized_pl", 0)
+    plpc = p.get("unrealized_plpc", 0)
+    pl_color = "color:#4CAF50" if pl >= 0 else "color:#F44336"
+    pl_sign = "+" if pl >= 0 else ""
+    return (
+        f"<tr><td><strong>{e(p['symbol'])}</strong></td>"
+        f"<td>{p.get('qty', 0):.1f}</td>"
+        f"<td>${p.get('avg_entry_price', 0):.2f}</td>"
+        f"<td>${p.get('market_value', 0):,.0f}</td>"
+        f"<td style='{pl_color}'>{pl_sign}${abs(pl):,.0f}</td>"
+        f"<td style='{pl_color}'>{pl_sign}{abs(plpc):.1%}</td></tr>"
+    )
+
+
+def _html_tier3_row(b: StockBriefing) -> str:
+    e = html_module.escape
+    moat = getattr(b.analysis, "moat_rating", None)
+    moat_str = moat.label if moat else "N/A"
+    conv = getattr(b.analysis, "conviction_level", "N/A")
+    pe_str = f"{b.pe_ratio:.1f}" if b.pe_ratio else "—"
+    fcf_str = f"{b.fcf_yield:.1%}" if b.fcf_yield is not None else "—"
+    return (
+        f"<tr><td><strong>{b.escaped_symbol}</strong></td>"
+        f"<td>{e(moat_str)}</td>"
+        f"<td>{e(conv)}</td>"
+        f"<td>{e(pe_str)}</td>"
+        f"<td>{e(fcf_str)}</td></tr>"
+    )
@@ -15,14 +15,19 @@ v2.0 — Two responsibilities:
 Uses yfinance (free) and Finnhub (free tier, optional).
 """
 
+import json
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 import requests
 import yfinance as yf
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +60,29 @@ TRENDING_STOCKS = [
     "LCID",
 ]
 
+# On-disk cache of upstream responses: {_cache_dir}/{SYMBOL}/{endpoint}.json
+_cache_dir = Path("data/bubble")
+
+# How long each cached endpoint stays fresh, in hours. Fundamentals move at
+# most daily; VIX is the only input that needs to be close to live.
+CACHE_TTL_HOURS = {
+    "info": 6,
+    "vix": 1,
+    "technicals": 24,
+    "insider": 24,
+}
+
+# Upstream fetches currently running, keyed by (SYMBOL, endpoint). A thread
+# that misses the cache while the same key is in flight waits on the running
+# fetch instead of issuing a duplicate request.
+_inflight: dict[tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+# Worker threads for scan_for_bubbles. Each symbol is a blocking yfinance (and
+# optional Finnhub) round-trip, so threads overlap the network waits; the cap
+# keeps the burst polite towards Yahoo's rate limiting.
+_SCAN_WORKERS = 8
+
 # Market regime thresholds
 REGIME_THRESHOLDS = {
     "pe_euphoria": 30,  # S&P 500 P/E above this = euphoria
@@ -108,7 +136,7 @@ class MarketRegime:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BubbleWarning:
     """A stock flagged as potentially overvalued"""
 
@@ -150,6 +178,90 @@ class BubbleWarning:
         }
 
 
+# ─────────────────────────────────────────────────────────────
+# Response cache
+# ─────────────────────────────────────────────────────────────
+
+
+def set_bubble_cache_dir(path: Path) -> None:
+    """Override the bubble detector cache directory (used in tests)."""
+    global _cache_dir
+    _cache_dir = Path(path)
+
+
+def _cache_path(symbol: str, endpoint: str) -> Path:
+    return _cache_dir / symbol.upper() / f"{endpoint}.json"
+
+
+def _load_cached(symbol: str, endpoint: str) -> Optional[Any]:
+    """Cached payload for (symbol, endpoint), or None if missing or older than its TTL."""
+    path = _cache_path(symbol, endpoint)
+    if not path.exists():
+        return None
+    try:
+        blob = json.loads(path.read_text(encoding="utf-8"))
+        fetched = datetime.fromisoformat(blob.get("fetched_at", "2000-01-01"))
+        if datetime.now() - fetched < timedelta(hours=CACHE_TTL_HOURS[endpoint]):
+            return blob.get("data")
+    except Exception as e:
+        logger.debug(f"Error reading bubble cache {path}: {e}")
+    return None
+
+
+def _save_cache(symbol: str, endpoint: str, data: Any) -> None:
+    try:
+        path = _cache_path(symbol, endpoint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"fetched_at": datetime.now().isoformat(), "data": data}, default=str), encoding="utf-8"
+        )
+    except Exception as e:
+        logger.warning(f"Could not cache {endpoint} for {symbol}: {e}")
+
+
+def _coalesced(key: tuple[str, str], fetch: Callable[[], Any]) -> Any:
+    """
+    Run fetch() once per key across threads.
+
+    The first caller runs it; callers arriving while it is in flight block on
+    the same Future and get its result, or its exception re-raised.
+    """
+    with _inflight_lock:
+        running = _inflight.get(key)
+        if running is None:
+            owned: Future = Future()
+            _inflight[key] = owned
+    if running is not None:
+        return running.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        owned.set_exception(e)
+        raise
+    else:
+        owned.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _fetch_info(symbol: str, endpoint: str = "info") -> dict:
+    """yfinance Ticker.info, served from the disk cache while fresh."""
+    info = _load_cached(symbol, endpoint)
+    if info is None:
+        info = _coalesced((symbol.upper(), endpoint), lambda: _download_info(symbol, endpoint))
+    return info or {}
+
+
+def _download_info(symbol: str, endpoint: str) -> dict:
+    info = yf.Ticker(symbol).info
+    if info:
+        _save_cache(symbol, endpoint, info)
+    return info
+
+
 # ─────────────────────────────────────────────────────────────
 # Market Regime Classifier
 # ─────────────────────────────────────────────────────────────
@@ -304,8 +416,7 @@ def _fetch_market_pe() -> Optional[float]:
     try:
         # Try VOO first (better P/E data), then SPY
         for ticker_symbol in ["VOO", "SPY"]:
-            ticker = yf.Ticker(ticker_symbol)
-            info = ticker.info
+            info = _fetch_info(ticker_symbol)
             pe = info.get("trailingPE")
             if pe and pe > 0:
                 return float(pe)
@@ -317,8 +428,7 @@ def _fetch_market_pe() -> Optional[float]:
 def _fetch_vix() -> Optional[float]:
     """Fetch current VIX level."""
     try:
-        vix = yf.Ticker("^VIX")
-        info = vix.info
+        info = _fetch_info("^VIX", "vix")
         price = info.get("regularMarketPrice") or info.get("previousClose")
         if price:
             return float(price)
@@ -335,6 +445,13 @@ def _fetch_spy_technicals() -> tuple[Optional[float], Optional[float]]:
         (drawdown_from_peak, distance_from_200ma)
         Both as decimal fractions (e.g., -0.10 = 10% drawdown).
     """
+    cached = _load_cached("SPY", "technicals")
+    if cached is not None:
+        return cached[0], cached[1]
+    return _coalesced(("SPY", "technicals"), _download_spy_technicals)
+
+
+def _download_spy_technicals() -> tuple[Optional[float], Optional[float]]:
     try:
         spy = yf.Ticker("SPY")
         hist = spy.history(period="1y")
@@ -352,6 +469,10 @@ def _fetch_spy_technicals() -> tuple[Optional[float], Optional[float]]:
         ma_200 = hist["Close"].rolling(window=min(200, len(hist))).mean().iloc[-1]
         distance_200ma = (current_price - ma_200) / ma_200 if ma_200 > 0 else None
 
+        # Plain floats so the pair round-trips through the JSON cache
+        drawdown = float(drawdown) if drawdown is not None else None
+        distance_200ma = float(distance_200ma) if distance_200ma is not None else None
+        _save_cache("SPY", "technicals", [drawdown, distance_200ma])
         return drawdown, distance_200ma
 
     except Exception as e:
@@ -406,6 +527,11 @@ class BubbleDetector:
     def __init__(self, finnhub_key: Optional[str] = None):
         self.finnhub_key = finnhub_key or os.getenv("FINNHUB_API_KEY")
 
+        # One keep-alive pool for Finnhub, sized for the scan workers, so
+        # each symbol skips a fresh TCP + TLS handshake.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=_SCAN_WORKERS))
+
     def scan_for_bubbles(self, symbols: Optional[list[str]] = None) -> list[BubbleWarning]:
         """
         Scan stocks for bubble characteristics.
@@ -415,29 +541,31 @@ class BubbleDetector:
 
         if symbols is None:
             symbols = TRENDING_STOCKS
+        if not symbols:
+            return []
 
-        warnings = []
-
-        for symbol in symbols:
-            try:
-                warning = self._analyze_stock(symbol)
-                if warning and warning.signal_count >= 2:
-                    warnings.append(warning)
-            except Exception as e:
-                logger.debug(f"Error analyzing {symbol}: {e}")
-                continue
+        # pool.map keeps input order, so ties in the sort below stay stable
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(symbols))) as pool:
+            warnings = [w for w in pool.map(self._scan_symbol, symbols) if w and w.signal_count >= 2]
 
         # Sort by signal count (most dangerous first)
         warnings.sort(key=lambda w: w.signal_count, reverse=True)
 
         return warnings
 
+    def _scan_symbol(self, symbol: str) -> Optional[BubbleWarning]:
+        """_analyze_stock for one worker thread; errors are logged, not raised."""
+        try:
+            return self._analyze_stock(symbol)
+        except Exception as e:
+            logger.debug(f"Error analyzing {symbol}: {e}")
+            return None
+
     def _analyze_stock(self, symbol: str) -> Optional[BubbleWarning]:
         """Analyze a single stock for bubble signals using yfinance"""
 
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = _fetch_info(symbol)
         except Exception as e:
             logger.debug(f"Failed to fetch {symbol}: {e}")
             return None
@@ -541,8 +669,12 @@ class BubbleDetector:
         if not self.finnhub_key:
             return None
 
+        cached = _load_cached(symbol, "insider")
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.get(
+            response = self._session.get(
                 "https://finnhub.io/api/v1/stock/insider-transactions",
                 params={"symbol": symbol, "token": self.finnhub_key},
                 timeout=10,
@@ -556,12 +688,14 @@ class BubbleDetector:
                     buys = sum(1 for t in data[:20] if t.get("transactionType") == "P")
                     sells = sum(1 for t in data[:20] if t.get("transactionType") == "S")
 
-                    return {
+                    activity = {
                         "net_transactions": buys - sells,
                         "buys": buys,
                         "sells": sells,
                         "summary": f"{sells} sells, {buys} buys recently",
                     }
+                    _save_cache(symbol, "insider", activity)
+                    return activity
         except Exception as e:
             logger.debug(f"Finnhub insider error for {symbol}: {e}")
 
@@ -81,7 +81,7 @@ class TierAssignment:
     approaching_target: bool = False  # True when B-tier stock within proximity_alert_pct of target
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchlistMovement:
     """A tier change since the last run."""
 
@@ -0,0 +1,351 @@
+"""
+Tests for src/briefing — text, HTML, and JSON briefing output.
+
+No LLM calls, no external APIs. Analyses are duck-typed SimpleNamespaces,
+the same shape run_monthly_briefing uses for registry-only entries.
+"""
+
+import gzip
+import io
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import src.briefing as briefing_pkg
+from src.analyzer import MoatRating
+from src.briefing import BriefingGenerator, StockBriefing, html_formatter, text_formatter
+from src.briefing.html_formatter import generate_html_report, write_html_report
+from src.briefing.text_formatter import generate_text_report, write_text_report
+from src.tier_engine import WatchlistMovement
+from src.valuation import AggregatedValuation, ValuationEstimate
+
+# ─── Helpers ──────────────────────────────────────────────────────────────────
+
+_NOW = datetime(2026, 1, 15, 9, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned, so report headers are reproducible."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW
+
+
+def _analysis(**overrides) -> SimpleNamespace:
+    fields = {
+        "moat_rating": None,
+        "conviction_level": "HIGH",
+        "investment_thesis": "Durable franchise",
+        "key_risks": ["Competition"],
+        "thesis_risks": ["Pricing power lost"],
+        "moat_risks": "New entrants",
+        "management_rating": None,
+        "moat_sources": [],
+        "to_dict": lambda: {"conviction": "HIGH"},
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _complete_tier1(symbol: str = "AAPL") -> StockBriefing:
+    """Tier 1 briefing with every optional card field populated."""
+    return _briefing(
+        symbol,
+        analysis=_analysis(moat_rating=MoatRating.WIDE),
+        valuation=AggregatedValuation(
+            symbol=symbol,
+            current_price=100.0,
+            estimates=[ValuationEstimate(source="DCF", fair_value=130.0, methodology="DCF", date=_NOW)],
+        ),
+        position_size={"conviction": "HIGH", "recommended_pct": 0.05, "recommended_amount": 5000},
+        fcf_yield=0.06,
+        operating_margin=0.3,
+    )
+
+
+def _briefing(symbol: str = "AAPL", tier: int = 1, **overrides) -> StockBriefing:
+    fields = {
+        "symbol": symbol,
+        "company_name": f"{symbol} Corp",
+        "current_price": 100.0,
+        "market_cap": 1e9,
+        "pe_ratio": 15.0,
+        "debt_equity": 0.5,
+        "roe": 0.2,
+        "revenue_growth": 0.1,
+        "valuation": AggregatedValuation(symbol=symbol, current_price=100.0, estimates=[]),
+        "analysis": _analysis(),
+        "tier": tier,
+        "tier_reason": "Wide moat at fair price",
+        "target_entry_price": 105.0,
+        "price_gap_pct": -0.05,
+        "generated_at": _NOW,
+    }
+    fields.update(overrides)
+    return StockBriefing(**fields)
+
+
+# ─── HTML report ──────────────────────────────────────────────────────────────
+
+
+class TestHtmlReport:
+    def test_parallel_cards_match_sequential(self, monkeypatch):
+        """Thread-pool card rendering must keep card order and content identical."""
+        monkeypatch.setattr(html_formatter, "datetime", _FrozenDatetime)
+        briefings = [_briefing(f"T{i}", tier=1 + i % 2, price_gap_pct=0.01 * i) for i in range(8)]
+
+        sequential = generate_html_report(briefings)
+        monkeypatch.setattr(html_formatter, "_PARALLEL_CARD_THRESHOLD", 0)
+        parallel = generate_html_report(briefings)
+
+        assert parallel == sequential
+
+    def test_streamed_report_matches_string(self, monkeypatch):
+        """write_html_report must emit exactly what generate_html_report returns."""
+        monkeypatch.setattr(html_formatter, "datetime", _FrozenDatetime)
+        briefings = [_briefing("AAPL"), _briefing("MSFT", tier=2, price_gap_pct=0.2), _briefing("KO", tier=3)]
+        kwargs = {"market_temp": {"temperature": "COOL"}, "radar_stocks": ["NVDA", "AMD"]}
+
+        buf = io.StringIO()
+        write_html_report(buf, briefings, **kwargs)
+
+        assert buf.getvalue() == generate_html_report(briefings, **kwargs)
+
+    def test_identity_fields_escaped_once(self):
+        """Pre-escaped symbol/name/reason must appear escaped, never double-escaped."""
+        b = _briefing("A&B", company_name="<Acme>", tier_reason="Cheap & wide")
+        html = generate_html_report([b])
+
+        assert "A&amp;B: &lt;Acme&gt;" in html
+        assert "Cheap &amp; wide" in html
+        assert "&amp;amp;" not in html
+
+    def test_null_company_name_and_reason_render(self):
+        """Registry rows can carry a null company_name; construction must not fail."""
+        b = _briefing("AAPL", company_name=None, tier_reason=None)
+
+        assert b.escaped_company == ""
+        assert b.escaped_reason == ""
+        assert "<h3>AAPL: </h3>" in generate_html_report([b])
+        assert "AAPL" in generate_text_report([b])
+
+    def test_injected_now_drives_report_date(self):
+        html = generate_html_report([_briefing("AAPL")], now=datetime(2031, 7, 1))
+
+        assert "July 2031" in html
+
+    def test_complete_tier1_fast_path_matches_generic_card(self, monkeypatch):
+        """The straight-line Tier 1 card must render the same markup as the generic card."""
+        b = _complete_tier1()
+        assert html_formatter._is_complete_tier1(b)
+        fast = html_formatter._html_stock_card(b, "tier1")
+
+        monkeypatch.setattr(html_formatter, "_is_complete_tier1", lambda _b: False)
+        assert html_formatter._html_stock_card(b, "tier1") == fast
+
+    def test_movement_badges_from_lookup_and_fallback(self):
+        movements = [
+            WatchlistMovement("AAPL", "tier_up", "B -> A"),
+            WatchlistMovement("MSFT", "re_rated", "manual"),
+        ]
+        html = generate_html_report([_briefing("AAPL")], movements=movements)
+
+        assert '<span class="movement-badge mv-up">TIER UP</span>' in html
+        assert '<span class="movement-badge mv-removed">RE RATED</span>' in html
+
+    def test_tranches_computed_once_for_tier1(self):
+        """The staged-entry plan is built at construction and shared by both formatters."""
+        assert _briefing("AAPL").tranches
+        assert _briefing("MSFT", tier=2).tranches == []
+        assert _briefing("KO", target_entry_price=None).tranches == []
+
+
+# ─── Text report ──────────────────────────────────────────────────────────────
+
+
+class TestTextReport:
+    def test_streamed_report_matches_string(self, monkeypatch):
+        """write_text_report must emit exactly what generate_text_report returns."""
+        monkeypatch.setattr(text_formatter, "datetime", _FrozenDatetime)
+        briefings = [_complete_tier1(), _briefing("MSFT", tier=2, price_gap_pct=0.05), _briefing("KO", tier=3)]
+        kwargs = {"market_temp": {"temperature": "COOL"}, "radar_stocks": ["NVDA", "AMD"]}
+
+        buf = io.StringIO()
+        write_text_report(buf, briefings, **kwargs)
+
+        assert buf.getvalue() == generate_text_report(briefings, **kwargs)
+
+    def test_sector_bars_clamped_at_both_ends(self):
+        exposure = {"Shorts": -0.05, "Cash": 0.0, "Tech": 0.5, "Levered": 1.4}
+        text = generate_text_report([_briefing("AAPL")], portfolio_summary={"sector_exposure": exposure})
+        bars = {
+            line.split()[0]: line.split()[1:-1] for line in text.splitlines() if line.startswith("  ") and "%" in line
+        }
+
+        assert bars["Shorts"] == []
+        assert bars["Cash"] == []
+        assert bars["Tech"] == ["#" * 10]
+        assert bars["Levered"] == ["#" * 20]
+
+    def test_injected_now_drives_report_date(self):
+        text = generate_text_report([_briefing("AAPL")], now=datetime(2031, 7, 1, 8, 30))
+
+        assert "WATCHLIST UPDATE - July 2031" in text
+        assert "Generated: 2031-07-01 08:30" in text
+
+
+# ─── BriefingGenerator ────────────────────────────────────────────────────────
+
+
+class TestBriefingGenerator:
+    def test_empty_run_writes_stub_only(self, tmp_path, monkeypatch):
+        """With no briefings and no supporting data, only a stub text file is written."""
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+
+        text = BriefingGenerator(str(tmp_path)).generate_briefing([])
+
+        assert "No data this month." in text
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["briefing_2026_01.txt"]
+
+    def test_supporting_data_alone_still_renders_full_report(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+
+        text = BriefingGenerator(str(tmp_path)).generate_briefing([], radar_stocks=["NVDA"])
+
+        assert "## RADAR" in text
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_formats_limit_files_written(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+
+        text = BriefingGenerator(str(tmp_path)).generate_briefing([_briefing("AAPL")], formats=("txt",))
+
+        assert "AAPL" in text
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["briefing_2026_01.txt"]
+
+    def test_compressed_html_matches_plain(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+        monkeypatch.setattr(html_formatter, "datetime", _FrozenDatetime)
+        briefings = [_complete_tier1(), _briefing("MSFT", tier=2)]
+
+        plain = BriefingGenerator(str(tmp_path / "plain"))
+        plain.generate_briefing(briefings, formats=("html",))
+        packed = BriefingGenerator(str(tmp_path / "gz"), compress_html=True)
+        packed.generate_briefing(briefings, formats=("html",))
+
+        assert packed.html_path.name == "briefing_2026_01.html.gz"
+        assert gzip.decompress(packed.html_path.read_bytes()).decode() == plain.html_path.read_text()
+
+    def test_read_html_decompresses_for_email(self, tmp_path, monkeypatch):
+        """The email path reads the report through read_html(), compressed or not."""
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+        monkeypatch.setattr(html_formatter, "datetime", _FrozenDatetime)
+        briefings = [_complete_tier1()]
+
+        plain = BriefingGenerator(str(tmp_path / "plain"))
+        assert plain.read_html() is None
+        plain.generate_briefing(briefings, formats=("html",))
+        packed = BriefingGenerator(str(tmp_path / "gz"), compress_html=True)
+        packed.generate_briefing(briefings, formats=("html",))
+
+        assert packed.read_html() == plain.read_html() == plain.html_path.read_text(encoding="utf-8")
+        assert packed.read_html().startswith("<!DOCTYPE html>")
+
+    def test_read_html_reflects_only_the_latest_call(self, tmp_path):
+        """A reused generator must not hand back a previous run's HTML."""
+        generator = BriefingGenerator(str(tmp_path))
+        generator.generate_briefing([_briefing("AAPL")], formats=("html",))
+        assert generator.read_html() is not None
+
+        generator.generate_briefing([_briefing("AAPL")], formats=("txt",))
+        assert generator.read_html() is None
+
+        generator.generate_briefing([_briefing("AAPL")], formats=("html",))
+        generator.generate_briefing([])  # empty-data stub path
+        assert generator.read_html() is None
+
+    def test_unknown_format_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="pdf"):
+            BriefingGenerator(str(tmp_path)).generate_briefing([_briefing("AAPL")], formats=("txt", "pdf"))
+
+
+# ─── JSON sidecar ─────────────────────────────────────────────────────────────
+
+
+class TestJsonOutput:
+    def test_non_numeric_tiers_are_skipped(self):
+        """Letter tiers from a fresh assignment must not break the tier partition."""
+        briefings = [_briefing("AAPL"), _briefing("MSFT", tier=2, approaching_target=True), _briefing("KO", tier="S")]
+
+        data = briefing_pkg._build_json_output(briefings, None, None, None, None, None, now=_NOW)
+
+        assert [d["symbol"] for d in data["tier1"]] == ["AAPL"]
+        assert data["summary"]["approaching_target"] == 1
+        assert data["summary"]["total_analyzed"] == 3
+
+    def test_orjson_and_stdlib_write_same_document(self, tmp_path, monkeypatch):
+        """The orjson fast path must serialize to the same JSON as the stdlib fallback."""
+        monkeypatch.setattr(briefing_pkg, "datetime", _FrozenDatetime)
+        briefings = [_complete_tier1(), _briefing("MSFT", tier=2), _briefing("KO", tier=3)]
+        portfolio = {"position_count": 2, "total_invested": 1234.5}
+
+        BriefingGenerator(str(tmp_path / "fast")).generate_briefing(briefings, portfolio_summary=portfolio)
+        monkeypatch.setattr(briefing_pkg, "_HAS_ORJSON", False)
+        BriefingGenerator(str(tmp_path / "std")).generate_briefing(briefings, portfolio_summary=portfolio)
+
+        name = "briefing_2026_01.json"
+        fast = (tmp_path / "fast" / name).read_text()
+        assert json.loads(fast) == json.loads((tmp_path / "std" / name).read_text())
+
+    def test_stdlib_fallback_matches_orjson_for_non_json_types(self, tmp_path, monkeypatch):
+        np = pytest.importorskip("numpy")
+        data = {
+            "when": datetime(2026, 1, 15, 9, 30, 0, 250),
+            "count": np.int64(7),
+            "ratio": np.float32(0.5),
+            "flag": np.bool_(True),
+            "series": np.arange(3),
+            "missing": float("nan"),
+            "nested": [np.float64("nan"), float("inf"), {"at": datetime(2026, 1, 1).date()}],
+            "tags": ("a", "b"),
+            "moat": MoatRating.WIDE,
+            "movement": WatchlistMovement("AAPL", "tier_up", "B -> A", previous_tier="B", current_tier="A"),
+            MoatRating.NARROW: 1,
+        }
+        expected = {
+            "when": "2026-01-15T09:30:00.000250",
+            "count": 7,
+            "ratio": 0.5,
+            "flag": True,
+            "series": [0, 1, 2],
+            "missing": None,
+            "nested": [None, None, {"at": "2026-01-01"}],
+            "tags": ["a", "b"],
+            "moat": "wide",
+            "movement": {
+                "symbol": "AAPL",
+                "change_type": "tier_up",
+                "detail": "B -> A",
+                "previous_tier": "B",
+                "current_tier": "A",
+            },
+            "narrow": 1,
+        }
+
+        briefing_pkg._write_json(tmp_path / "fast.json", data)
+        monkeypatch.setattr(briefing_pkg, "_HAS_ORJSON", False)
+        briefing_pkg._write_json(tmp_path / "std.json", data)
+
+        assert json.loads((tmp_path / "fast.json").read_text()) == expected
+        assert json.loads((tmp_path / "std.json").read_text()) == expected
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self, tmp_path):
+        """An integer wider than 64 bits must not abort the sidecar write."""
+        path = tmp_path / "big.json"
+
+        briefing_pkg._write_json(path, {"shares_outstanding": 2**70, "symbol": "AAPL"})
+
+        assert json.loads(path.read_text()) == {"shares_outstanding": 2**70, "symbol": "AAPL"}
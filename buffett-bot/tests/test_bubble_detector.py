@@ -0,0 +1,167 @@
+"""
+Tests for src/bubble_detector.py — bubble stock scan and response cache.
+
+yfinance and Finnhub are never called: _analyze_stock or yf.Ticker is patched
+per test, and the disk cache points at a temporary directory.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+
+import src.bubble_detector as bubble_detector
+from src.bubble_detector import BubbleDetector, BubbleWarning
+
+
+def _warning(symbol: str, signal_count: int) -> BubbleWarning:
+    return BubbleWarning(
+        symbol=symbol,
+        company_name=f"{symbol} Inc",
+        current_price=100.0,
+        signals=["signal"] * signal_count,
+        signal_count=signal_count,
+    )
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(bubble_detector, "_cache_dir", tmp_path / "bubble")
+    return tmp_path / "bubble"
+
+
+@pytest.fixture
+def detector() -> BubbleDetector:
+    return BubbleDetector(finnhub_key=None)
+
+
+@pytest.fixture
+def ticker_calls(monkeypatch) -> list[str]:
+    """Patch yf.Ticker with a stub that records each upstream lookup."""
+    calls: list[str] = []
+
+    def fake_ticker(symbol: str) -> SimpleNamespace:
+        calls.append(symbol)
+        return SimpleNamespace(info={"trailingPE": 21.5, "regularMarketPrice": 18.0})
+
+    monkeypatch.setattr(bubble_detector.yf, "Ticker", fake_ticker)
+    return calls
+
+
+# ─── scan_for_bubbles ─────────────────────────────────────────────────────────
+
+
+class TestScanForBubbles:
+    def test_keeps_two_plus_signals_sorted_by_count(self, detector, monkeypatch):
+        counts = {"AAA": 2, "BBB": 1, "CCC": 4, "DDD": 2}
+        monkeypatch.setattr(detector, "_analyze_stock", lambda s: _warning(s, counts[s]))
+
+        warnings = detector.scan_for_bubbles(list(counts))
+
+        # Ties keep input order
+        assert [w.symbol for w in warnings] == ["CCC", "AAA", "DDD"]
+
+    def test_failing_symbol_is_skipped(self, detector, monkeypatch):
+        def analyze(symbol: str) -> Optional[BubbleWarning]:
+            if symbol == "BAD":
+                raise RuntimeError("upstream error")
+            return _warning(symbol, 3)
+
+        monkeypatch.setattr(detector, "_analyze_stock", analyze)
+
+        assert [w.symbol for w in detector.scan_for_bubbles(["AAA", "BAD", "CCC"])] == ["AAA", "CCC"]
+
+    def test_empty_symbol_list(self, detector):
+        assert detector.scan_for_bubbles([]) == []
+
+
+# ─── Response cache ───────────────────────────────────────────────────────────
+
+
+class TestResponseCache:
+    def test_info_served_from_cache_while_fresh(self, ticker_calls):
+        assert bubble_detector._fetch_market_pe() == 21.5
+        assert bubble_detector._fetch_market_pe() == 21.5
+
+        assert ticker_calls == ["VOO"]
+
+    def test_expired_entry_is_refetched(self, cache, ticker_calls):
+        path = cache / "^VIX" / "vix.json"
+        path.parent.mkdir(parents=True)
+        stale = datetime.now() - timedelta(hours=2)
+        path.write_text(json.dumps({"fetched_at": stale.isoformat(), "data": {"regularMarketPrice": 99.0}}))
+
+        assert bubble_detector._fetch_vix() == 18.0
+        assert ticker_calls == ["^VIX"]
+
+    def test_cached_spy_technicals_skip_history(self, ticker_calls):
+        bubble_detector._save_cache("SPY", "technicals", [-0.12, None])
+
+        assert bubble_detector._fetch_spy_technicals() == (-0.12, None)
+        assert ticker_calls == []
+
+    def test_insider_activity_uses_shared_session_and_cache(self, monkeypatch):
+        detector = BubbleDetector(finnhub_key="test-key")
+        calls: list[dict] = []
+
+        def fake_get(url, params, timeout):
+            calls.append(params)
+            data = [{"transactionType": "S"}] * 3 + [{"transactionType": "P"}]
+            return SimpleNamespace(status_code=200, json=lambda: {"data": data})
+
+        monkeypatch.setattr(detector._session, "get", fake_get)
+
+        first = detector._get_insider_activity("TSLA")
+        assert first is not None and first["net_transactions"] == -2
+        assert detector._get_insider_activity("TSLA") == first
+        assert [c["symbol"] for c in calls] == ["TSLA"]
+
+
+# ─── In-flight coalescing ─────────────────────────────────────────────────────
+
+
+class TestCoalescing:
+    def test_concurrent_callers_share_one_fetch(self):
+        release = threading.Event()
+        calls: list[str] = []
+
+        def slow_fetch() -> str:
+            calls.append("owner")
+            release.wait(timeout=5)
+            return "payload"
+
+        results: list[str] = []
+        owner = threading.Thread(target=lambda: results.append(bubble_detector._coalesced(("X", "info"), slow_fetch)))
+        owner.start()
+        try:
+            deadline = time.monotonic() + 5
+            while ("X", "info") not in bubble_detector._inflight:
+                assert time.monotonic() < deadline, "owner never registered its in-flight fetch"
+                time.sleep(0.001)
+            waiter = threading.Thread(
+                target=lambda: results.append(bubble_detector._coalesced(("X", "info"), lambda: calls.append("dup")))
+            )
+            waiter.start()
+            waiter.join(timeout=0.2)
+            assert waiter.is_alive(), "waiter should block on the owner's Future"
+        finally:
+            release.set()
+        owner.join(timeout=5)
+        waiter.join(timeout=5)
+
+        assert calls == ["owner"]
+        assert results == ["payload", "payload"]
+        assert bubble_detector._inflight == {}
+
+    def test_failure_is_not_remembered(self):
+        def boom():
+            raise RuntimeError("upstream error")
+
+        with pytest.raises(RuntimeError):
+            bubble_detector._coalesced(("X", "info"), boom)
+
+        assert bubble_detector._coalesced(("X", "info"), lambda: "ok") == "ok"